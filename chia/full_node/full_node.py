@@ -107,8 +107,13 @@ class FullNode:
         self._ui_tasks = set()
 
         db_path_replaced: str = config["database_path"].replace("CHALLENGE", config["selected_network"])
-        self.db_path = path_from_root(root_path, db_path_replaced)
-        mkdir(self.db_path.parent)
+        self.db_path: Union[str, Path]
+        if db_path_replaced == ":memory:":
+            # An in-memory database is not durable, only used in tests
+            self.db_path = db_path_replaced
+        else:
+            self.db_path = path_from_root(root_path, db_path_replaced)
+            mkdir(self.db_path.parent)
 
     def _set_state_changed_callback(self, callback: Callable):
         self.state_changed_callback = callback
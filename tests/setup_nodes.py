@@ -1,8 +1,11 @@
 import asyncio
 import signal
 
+from functools import lru_cache
 from secrets import token_bytes
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+import yaml
 
 from chia.consensus.constants import ConsensusConstants
 from chia.daemon.server import WebSocketServer, create_server_for_daemon, daemon_launch_lock_path, singleton
@@ -19,17 +22,34 @@ from chia.timelord.timelord_launcher import kill_processes, spawn_process
 from chia.types.peer_info import PeerInfo
 from chia.util.bech32m import encode_puzzle_hash
 from chia.util.block_tools import BlockTools, test_constants
+from chia.util.config import initial_config_file
 from chia.util.hash import std_hash
 from chia.util.ints import uint16, uint32
 from chia.util.keychain import Keychain, bytes_to_mnemonic
 from tests.time_out_assert import time_out_assert_custom_interval
 
-bt = BlockTools(constants=test_constants)
 
-self_hostname = bt.config["self_hostname"]
+@lru_cache(maxsize=None)
+def _block_tools() -> BlockTools:
+    return BlockTools(constants=test_constants)
+
+
+def __getattr__(name: str) -> BlockTools:
+    # BlockTools loads plots and keys, so only build it for modules that use it
+    if name == "bt":
+        return _block_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Test nodes do not need a durable blockchain, so keep it in sqlite's memory
+IN_MEMORY_DB = ":memory:"
 
+self_hostname = yaml.safe_load(initial_config_file("config.yaml"))["self_hostname"]
 
-def constants_for_dic(dic):
+
+def constants_for_dic(dic: Optional[Dict[str, Any]]) -> ConsensusConstants:
+    if not dic:
+        return test_constants
     return test_constants.replace(**dic)
 
 
@@ -71,8 +91,8 @@ async def setup_full_node(
     sanitize_weight_proof_only=False,
     connect_to_daemon=False,
 ):
-    db_path = local_bt.root_path / f"{db_name}"
-    if db_path.exists():
+    db_path = None if db_name == IN_MEMORY_DB else local_bt.root_path / f"{db_name}"
+    if db_path is not None and db_path.exists():
         db_path.unlink()
     config = local_bt.config["full_node"]
     config["database_path"] = db_name
@@ -108,7 +128,7 @@ async def setup_full_node(
 
     service.stop()
     await service.wait_closed()
-    if db_path.exists():
+    if db_path is not None and db_path.exists():
         db_path.unlink()
 
 
@@ -121,7 +141,7 @@ async def setup_wallet_node(
     key_seed=None,
     starting_height=None,
 ):
-    config = bt.config["wallet"]
+    config = local_bt.config["wallet"]
     config["port"] = port
     config["rpc_port"] = port + 1000
     if starting_height is not None:
@@ -138,7 +158,7 @@ async def setup_wallet_node(
     db_path_key_suffix = str(first_pk.get_fingerprint())
     db_name = f"test-wallet-db-{port}-KEY.sqlite"
     db_path_replaced: str = db_name.replace("KEY", db_path_key_suffix)
-    db_path = bt.root_path / db_path_replaced
+    db_path = local_bt.root_path / db_path_replaced
 
     if db_path.exists():
         db_path.unlink()
@@ -204,8 +224,8 @@ async def setup_farmer(
     b_tools,
     full_node_port: Optional[uint16] = None,
 ):
-    config = bt.config["farmer"]
-    config_pool = bt.config["pool"]
+    config = b_tools.config["farmer"]
+    config_pool = b_tools.config["pool"]
 
     config["xch_target_address"] = encode_puzzle_hash(b_tools.farmer_ph, "xch")
     config["pool_public_keys"] = [bytes(pk).hex() for pk in b_tools.pool_pubkeys]
@@ -234,10 +254,12 @@ async def setup_farmer(
     await service.wait_closed()
 
 
-async def setup_introducer(port):
+async def setup_introducer(port, b_tools: Optional[BlockTools] = None):
+    if b_tools is None:
+        b_tools = _block_tools()
     kwargs = service_kwargs_for_introducer(
-        bt.root_path,
-        bt.config["introducer"],
+        b_tools.root_path,
+        b_tools.config["introducer"],
     )
     kwargs.update(
         advertised_port=port,
@@ -315,15 +337,14 @@ async def setup_two_nodes(consensus_constants: ConsensusConstants):
     """
     node_iters = [
         setup_full_node(
-            consensus_constants, "blockchain_test.db", 21234, BlockTools(constants=test_constants), simulator=False
+            consensus_constants, IN_MEMORY_DB, 21234, BlockTools(constants=test_constants), simulator=False
         ),
         setup_full_node(
-            consensus_constants, "blockchain_test_2.db", 21235, BlockTools(constants=test_constants), simulator=False
+            consensus_constants, IN_MEMORY_DB, 21235, BlockTools(constants=test_constants), simulator=False
         ),
     ]
 
-    fn1 = await node_iters[0].__anext__()
-    fn2 = await node_iters[1].__anext__()
+    fn1, fn2 = await asyncio.gather(*(node_iter.__anext__() for node_iter in node_iters))
 
     yield fn1, fn2, fn1.full_node.server, fn2.full_node.server
 
@@ -340,15 +361,13 @@ async def setup_n_nodes(consensus_constants: ConsensusConstants, n: int):
         node_iters.append(
             setup_full_node(
                 consensus_constants,
-                f"blockchain_test_{i}.db",
+                IN_MEMORY_DB,
                 port_start + i,
                 BlockTools(constants=test_constants),
                 simulator=False,
             )
         )
-    nodes = []
-    for ni in node_iters:
-        nodes.append(await ni.__anext__())
+    nodes = await asyncio.gather(*(ni.__anext__() for ni in node_iters))
 
     yield nodes
 
@@ -358,12 +377,11 @@ async def setup_n_nodes(consensus_constants: ConsensusConstants, n: int):
 async def setup_node_and_wallet(consensus_constants: ConsensusConstants, starting_height=None, key_seed=None):
     btools = BlockTools(constants=test_constants)
     node_iters = [
-        setup_full_node(consensus_constants, "blockchain_test.db", 21234, btools, simulator=False),
+        setup_full_node(consensus_constants, IN_MEMORY_DB, 21234, btools, simulator=False),
         setup_wallet_node(21235, consensus_constants, btools, None, starting_height=starting_height, key_seed=key_seed),
     ]
 
-    full_node_api = await node_iters[0].__anext__()
-    wallet, s2 = await node_iters[1].__anext__()
+    full_node_api, (wallet, s2) = await asyncio.gather(*(node_iter.__anext__() for node_iter in node_iters))
 
     yield full_node_api, wallet, full_node_api.full_node.server, s2
 
@@ -373,7 +391,7 @@ async def setup_node_and_wallet(consensus_constants: ConsensusConstants, startin
 async def setup_simulators_and_wallets(
     simulator_count: int,
     wallet_count: int,
-    dic: Dict,
+    dic: Optional[Dict[str, Any]] = None,
     starting_height=None,
     key_seed=None,
     starting_port=50000,
@@ -385,11 +403,10 @@ async def setup_simulators_and_wallets(
     consensus_constants = constants_for_dic(dic)
     for index in range(0, simulator_count):
         port = starting_port + index
-        db_name = f"blockchain_test_{port}.db"
         bt_tools = BlockTools(consensus_constants, const_dict=dic)  # block tools modifies constants
         sim = setup_full_node(
             bt_tools.constants,
-            db_name,
+            IN_MEMORY_DB,
             port,
             bt_tools,
             simulator=True,
@@ -422,8 +439,8 @@ async def setup_simulators_and_wallets(
 
 async def setup_farmer_harvester(consensus_constants: ConsensusConstants):
     node_iters = [
-        setup_harvester(21234, 21235, consensus_constants, bt),
-        setup_farmer(21235, consensus_constants, bt),
+        setup_harvester(21234, 21235, consensus_constants, _block_tools()),
+        setup_farmer(21235, consensus_constants, _block_tools()),
     ]
 
     harvester, harvester_server = await node_iters[0].__anext__()
@@ -442,24 +459,21 @@ async def setup_full_system(
     if b_tools_1 is None:
         b_tools_1 = BlockTools(constants=test_constants)
     node_iters = [
-        setup_introducer(21233),
+        setup_introducer(21233, b_tools),
         setup_harvester(21234, 21235, consensus_constants, b_tools),
         setup_farmer(21235, consensus_constants, b_tools, uint16(21237)),
         setup_vdf_clients(8000),
         setup_timelord(21236, 21237, False, consensus_constants, b_tools),
-        setup_full_node(
-            consensus_constants, "blockchain_test.db", 21237, b_tools, 21233, False, 10, True, connect_to_daemon
-        ),
-        setup_full_node(
-            consensus_constants, "blockchain_test_2.db", 21238, b_tools_1, 21233, False, 10, True, connect_to_daemon
-        ),
+        setup_full_node(consensus_constants, IN_MEMORY_DB, 21237, b_tools, 21233, False, 10, True, connect_to_daemon),
+        setup_full_node(consensus_constants, IN_MEMORY_DB, 21238, b_tools_1, 21233, False, 10, True, connect_to_daemon),
         setup_vdf_client(7999),
         setup_timelord(21239, 21238, True, consensus_constants, b_tools_1),
     ]
 
-    introducer, introducer_server = await node_iters[0].__anext__()
-    harvester, harvester_server = await node_iters[1].__anext__()
-    farmer, farmer_server = await node_iters[2].__anext__()
+    # Services reconnect to their peers, so each group can be started concurrently
+    (introducer, introducer_server), (harvester, harvester_server), (farmer, farmer_server) = await asyncio.gather(
+        *(node_iter.__anext__() for node_iter in node_iters[:3])
+    )
 
     async def num_connections():
         count = len(harvester.server.all_connections.items())
@@ -467,12 +481,14 @@ async def setup_full_system(
 
     await time_out_assert_custom_interval(10, 3, num_connections, 1)
 
-    vdf_clients = await node_iters[3].__anext__()
-    timelord, timelord_server = await node_iters[4].__anext__()
-    node_api_1 = await node_iters[5].__anext__()
-    node_api_2 = await node_iters[6].__anext__()
-    vdf_sanitizer = await node_iters[7].__anext__()
-    sanitizer, sanitizer_server = await node_iters[8].__anext__()
+    (
+        vdf_clients,
+        (timelord, timelord_server),
+        node_api_1,
+        node_api_2,
+        vdf_sanitizer,
+        (sanitizer, sanitizer_server),
+    ) = await asyncio.gather(*(node_iter.__anext__() for node_iter in node_iters[3:]))
 
     yield (
         node_api_1,
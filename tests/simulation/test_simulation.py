@@ -4,7 +4,7 @@ from chia.types.peer_info import PeerInfo
 from chia.util.block_tools import BlockTools
 from chia.util.ints import uint16
 from tests.core.node_height import node_height_at_least
-from tests.setup_nodes import self_hostname, setup_full_node, setup_full_system, test_constants
+from tests.setup_nodes import IN_MEMORY_DB, self_hostname, setup_full_node, setup_full_system, test_constants
 from tests.time_out_assert import time_out_assert
 
 test_constants_modified = test_constants.replace(
@@ -27,7 +27,7 @@ class TestSimulation:
     @pytest.fixture(scope="function")
     async def extra_node(self):
         b_tools = BlockTools(constants=test_constants_modified)
-        async for _ in setup_full_node(test_constants_modified, "blockchain_test_3.db", 21240, b_tools):
+        async for _ in setup_full_node(test_constants_modified, IN_MEMORY_DB, 21240, b_tools):
             yield _
 
     @pytest.fixture(scope="function")
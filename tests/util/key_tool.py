@@ -1,40 +1,99 @@
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from blspy import AugSchemeMPL, G2Element, PrivateKey
 
+from chia.types.blockchain_format.program import SerializedProgram
 from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.types.coin_solution import CoinSolution
+from chia.types.condition_opcodes import ConditionOpcode
+from chia.types.condition_with_args import ConditionWithArgs
 from chia.util.condition_tools import conditions_by_opcode, conditions_for_solution, pkm_pairs_for_conditions_dict
 from tests.core.make_block_generator import GROUP_ORDER, int_to_public_key
 from chia.util.block_tools import test_constants
 
 
-class KeyTool(dict):
-    @classmethod
-    def __new__(cls, *args):
-        return dict.__new__(*args)
+@lru_cache(maxsize=2048)
+def _private_key_for_exponent(secret_exponent: int) -> PrivateKey:
+    return PrivateKey.from_bytes(secret_exponent.to_bytes(32, "big"))
+
+
+def _sign_many(private_keys: List[PrivateKey], message_hashes: List[bytes]) -> List[G2Element]:
+    sign = AugSchemeMPL.sign
+    return [sign(sk, message_hash) for sk, message_hash in zip(private_keys, message_hashes)]
+
+
+@lru_cache(maxsize=512)
+def _conditions_dict_for(
+    puzzle_reveal_bytes: bytes, solution_bytes: bytes
+) -> Dict[ConditionOpcode, List[ConditionWithArgs]]:
+    err, conditions, cost = conditions_for_solution(
+        SerializedProgram.from_bytes(puzzle_reveal_bytes),
+        SerializedProgram.from_bytes(solution_bytes),
+        test_constants.MAX_BLOCK_COST_CLVM,
+    )
+    assert conditions is not None
+    return conditions_by_opcode(conditions)
+
+
+@lru_cache(maxsize=512)
+def _pkm_pairs_for(
+    puzzle_reveal_bytes: bytes, solution_bytes: bytes, coin_name: bytes32, additional_data: bytes
+) -> Tuple[Tuple[bytes, bytes], ...]:
+    # pkm_pairs_for_conditions_dict deserializes every public key, so keep the pairs in byte form
+    conditions_dict = _conditions_dict_for(puzzle_reveal_bytes, solution_bytes)
+    return tuple(
+        (bytes(public_key), message_hash)
+        for public_key, message_hash in pkm_pairs_for_conditions_dict(conditions_dict, coin_name, additional_data)
+    )
+
+
+class KeyTool:
+    __slots__ = ("_by_pk",)
+
+    def __init__(self) -> None:
+        self._by_pk: Dict[bytes, int] = {}
+
+    def get(self, public_key: bytes) -> Optional[int]:
+        return self._by_pk.get(public_key)
 
     def add_secret_exponents(self, secret_exponents: List[int]) -> None:
-        for _ in secret_exponents:
-            self[bytes(int_to_public_key(_))] = _ % GROUP_ORDER
+        public_keys = [int_to_public_key(secret_exponent) for secret_exponent in secret_exponents]
+        self._by_pk.update(
+            zip(map(bytes, public_keys), (secret_exponent % GROUP_ORDER for secret_exponent in secret_exponents))
+        )
 
-    def sign(self, public_key: bytes, message_hash: bytes32) -> G2Element:
-        secret_exponent = self.get(public_key)
-        if not secret_exponent:
+    def private_key(self, public_key: bytes) -> PrivateKey:
+        try:
+            secret_exponent = self._by_pk[public_key]
+        except KeyError:
             raise ValueError("unknown pubkey %s" % public_key.hex())
-        bls_private_key = PrivateKey.from_bytes(secret_exponent.to_bytes(32, "big"))
-        return AugSchemeMPL.sign(bls_private_key, message_hash)
+        return _private_key_for_exponent(secret_exponent)
+
+    def sign(self, public_key: bytes, message_hash: bytes32) -> G2Element:
+        return AugSchemeMPL.sign(self.private_key(public_key), message_hash)
 
-    def signature_for_solution(self, coin_solution: CoinSolution, additional_data: bytes) -> AugSchemeMPL:
-        signatures = []
-        err, conditions, cost = conditions_for_solution(
-            coin_solution.puzzle_reveal, coin_solution.solution, test_constants.MAX_BLOCK_COST_CLVM
+    def signature_for_solution(self, coin_solution: CoinSolution, additional_data: bytes) -> G2Element:
+        pairs = _pkm_pairs_for(
+            bytes(coin_solution.puzzle_reveal),
+            bytes(coin_solution.solution),
+            coin_solution.coin.name(),
+            additional_data,
         )
-        assert conditions is not None
-        conditions_dict = conditions_by_opcode(conditions)
-        for public_key, message_hash in pkm_pairs_for_conditions_dict(
-            conditions_dict, coin_solution.coin.name(), additional_data
-        ):
-            signature = self.sign(bytes(public_key), message_hash)
-            signatures.append(signature)
+        # AugSchemeMPL prepends the public key to each message, so private keys cannot be
+        # summed across pairs; the best we can do is sign each distinct pair only once
+        unique_pairs = list(dict.fromkeys(pairs))
+        private_keys = [self.private_key(public_key) for public_key, _ in unique_pairs]
+        message_hashes = [message_hash for _, message_hash in unique_pairs]
+        unique_signatures = _sign_many(private_keys, message_hashes)
+        if len(unique_pairs) == len(pairs):
+            # no repeated pairs, so the signatures are already in condition order
+            signatures = unique_signatures
+        else:
+            signed: Dict[Tuple[bytes, bytes], G2Element] = dict(zip(unique_pairs, unique_signatures))
+            signatures = [signed[pair] for pair in pairs]
+        if not signatures:
+            return G2Element()
+        if len(signatures) == 1:
+            return signatures[0]
         return AugSchemeMPL.aggregate(signatures)
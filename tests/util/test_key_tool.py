@@ -0,0 +1,85 @@
+from typing import List, Tuple
+
+from blspy import AugSchemeMPL, G1Element, G2Element
+
+from chia.types.blockchain_format.coin import Coin
+from chia.types.blockchain_format.program import Program
+from chia.types.coin_solution import CoinSolution
+from chia.types.condition_opcodes import ConditionOpcode
+from chia.util.hash import std_hash
+from chia.util.ints import uint64
+from chia.wallet.puzzles import p2_conditions
+from tests.core.make_block_generator import int_to_public_key
+from tests.util.key_tool import KeyTool
+
+ADDITIONAL_DATA = bytes([2] * 32)
+
+
+def public_key_for_exponent(secret_exponent: int, key_tool: KeyTool) -> bytes:
+    key_tool.add_secret_exponents([secret_exponent])
+    return bytes(int_to_public_key(secret_exponent))
+
+
+def coin_solution_for_conditions(conditions: List[List]) -> CoinSolution:
+    puzzle = p2_conditions.puzzle_for_conditions(Program.to(conditions))
+    coin = Coin(std_hash(b"key_tool parent"), puzzle.get_tree_hash(), uint64(1000))
+    return CoinSolution(coin, puzzle, Program.to(0))
+
+
+def agg_sig_me_coin_solution(pairs: List[Tuple[bytes, bytes]]) -> Tuple[CoinSolution, List[Tuple[bytes, bytes]]]:
+    """
+    Returns a coin solution for `pairs` of (public key, message), along with the pairs the
+    signature has to cover once AGG_SIG_ME appends the coin name and additional data.
+    """
+    coin_solution = coin_solution_for_conditions(
+        [[ConditionOpcode.AGG_SIG_ME, public_key, message] for public_key, message in pairs]
+    )
+    suffix = coin_solution.coin.name() + ADDITIONAL_DATA
+    return coin_solution, [(public_key, message + suffix) for public_key, message in pairs]
+
+
+def assert_valid_signature(key_tool: KeyTool, coin_solution: CoinSolution, signed_pairs: List[Tuple[bytes, bytes]]):
+    signature = key_tool.signature_for_solution(coin_solution, ADDITIONAL_DATA)
+
+    naive = AugSchemeMPL.aggregate([key_tool.sign(public_key, message) for public_key, message in signed_pairs])
+    assert signature == naive
+
+    public_keys = [G1Element.from_bytes(public_key) for public_key, _ in signed_pairs]
+    messages = [message for _, message in signed_pairs]
+    assert AugSchemeMPL.aggregate_verify(public_keys, messages, signature)
+
+
+class TestKeyTool:
+    def test_signature_for_solution_distinct_pairs(self):
+        key_tool = KeyTool()
+        pairs = [(public_key_for_exponent(1000 + i, key_tool), bytes([i]) * 32) for i in range(5)]
+        coin_solution, signed_pairs = agg_sig_me_coin_solution(pairs)
+        assert_valid_signature(key_tool, coin_solution, signed_pairs)
+
+    def test_signature_for_solution_repeated_pairs(self):
+        key_tool = KeyTool()
+        pk_1 = public_key_for_exponent(2000, key_tool)
+        pk_2 = public_key_for_exponent(2001, key_tool)
+        pairs = [
+            (pk_1, b"\x01" * 32),
+            (pk_2, b"\x02" * 32),
+            (pk_1, b"\x01" * 32),
+            (pk_1, b"\x03" * 32),
+            (pk_2, b"\x04" * 32),
+            (pk_2, b"\x02" * 32),
+            (pk_1, b"\x01" * 32),
+        ]
+        coin_solution, signed_pairs = agg_sig_me_coin_solution(pairs)
+        assert_valid_signature(key_tool, coin_solution, signed_pairs)
+
+    def test_signature_for_solution_without_pairs(self):
+        key_tool = KeyTool()
+        coin_solution = coin_solution_for_conditions([[ConditionOpcode.CREATE_COIN, std_hash(b"target"), 1000]])
+        assert key_tool.signature_for_solution(coin_solution, ADDITIONAL_DATA) == G2Element()
+
+    def test_signature_for_solution_single_pair(self):
+        key_tool = KeyTool()
+        public_key = public_key_for_exponent(3000, key_tool)
+        coin_solution, signed_pairs = agg_sig_me_coin_solution([(public_key, b"\x05" * 32)])
+        assert key_tool.signature_for_solution(coin_solution, ADDITIONAL_DATA) == key_tool.sign(*signed_pairs[0])
+        assert_valid_signature(key_tool, coin_solution, signed_pairs)